@@ -1,643 +1,1657 @@
-# 541
-
-"""
-TODO:
-1. anti-detection measures
-2. robust error handling
-3. data processing and export
-4. logging and monitoring
-5. ??
-
-"""
-
-import os, json, random, logging, time, tempfile
-import pandas as pd
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict
-from dataclasses import dataclass, asdict
-
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import (
-    TimeoutException, 
-    NoSuchElementException, 
-    WebDriverException,
-    ElementNotInteractableException
-)
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-
-
-@dataclass
-class EarningsEvent:
-    """
-    data structure for earnings events
-    using dataclass for clean, type-safe data handling
-    """
-    symbol: str
-    company_name: str
-    earnings_date: str
-    earnings_time: str  # "BMO", "AMC", or specific time
-    eps_estimate: Optional[float] = None
-    revenue_estimate: Optional[str] = None
-    market_cap: Optional[str] = None
-    sector: Optional[str] = None
-    scraped_timestamp: Optional[str] = None
-
-    def __post_init__(self):
-        """add timestamp when object is created """
-        if not self.scraped_timestamp:
-            self.scraped_timestamp = datetime.now().isoformat()
-
-
-class AntiDetectionSystem:
-    """
-    scraper looks and "acts" humaan
-    """
-
-    # real browser user agents
-    USER_AGENTS = [
-        "Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
-    ]
-
-    @classmethod
-    def get_stealth_chrome_options(cls) -> ChromeOptions:
-        options = ChromeOptions()
-
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-
-        options.add_argument("--disable-gpu")
-        options.add_argument("--disable-software-rasterizer")
-        options.add_argument("--remote-debugging-port=9222")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-plugins")
-        options.add_argument("--disable-web-security")
-        options.add_argument("--allow-running-insecure-content")
-
-        temp_dir = tempfile.mkdtemp()
-        options.add_argument(f"--user-data-dir={temp_dir}")
-        options.add_argument(f"--data-path={temp_dir}")
-        options.add_argument(f"--disk-cache-dir={temp_dir}")
-
-        options.add_argument("--disable-background-timer-throttling")
-        options.add_argument("--disable-backgrounding-occluded-windows")
-        options.add_argument("--disable-renderer-backgrounding")
-        options.add_argument("--disable-features=TranslateUI")
-        options.add_argument("--disable-ipc-flooding-protection")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--memory-pressure-off")
-        options.add_argument("--max_old_space_size=4096")
-
-        options.add_argument("--disable-default-apps")
-        options.add_argument("--disable-sync")
-
-        # random user agent
-        user_agent = random.choice(cls.USER_AGENTS)
-        options.add_argument(f'--user-agent={user_agent}')
-
-        return options
-
-    @staticmethod
-    def human_like_delay(min_seconds: float = 0.5, max_seconds: float = 3.0):
-        """
-        random delays that mimic human reading/thinking time
-
-        """
-        delay = random.uniform(min_seconds, max_seconds)
-        time.sleep(delay)
-
-    @staticmethod
-    def random_mouse_movement(driver):
-        """
-        move mouse randomly to simulate human behavior
-
-        """
-        try:
-            actions = ActionChains(driver)
-
-            # get page dimensions
-            page_width = driver.execute_script("return document.body.scrollWidth")
-            page_height = driver.execute_script("return document.body.scrollHeight")
-
-            # random mouse movements
-            for _ in range(random.randint(1, 3)):
-                x = random.randint(100, min(page_width - 100, 1200))
-                y = random.randint(100, min(page_height - 100, 800))
-
-                actions.move_by_offset(
-                    x - actions._get_center_of_element(driver.find_element(By.TAG_NAME, "body"))[0],
-                    y - actions._get_center_of_element(driver.find_element(By.TAG_NAME, "body"))[1]
-                )
-                actions.pause(random.uniform(0.1, 0.5))
-
-            actions.perform()
-        except:
-            pass
-
-
-class EarningsCalendarScraper:
-    """
-    gathers real-world financial data
-
-    """
-
-    def __init__(self, headless: bool = True, debug: bool = False):
-        self.headless = headless
-        self.debug = debug
-        self.driver = None
-        self.wait = None
-        self.logger = self._setup_logging()
-        self.scraped_events: List[EarningsEvent] = []
-        self.session_stats = {
-            'pages_scraped': 0,
-            'events_found': 0,
-            'errors_encountered': 0,
-            'start_time': None
-        }
-
-    def _setup_logging(self) -> logging.Logger:
-        """
-        cnfigure comprehensive logging
-        """
-        #
-        os.makedirs('logs', exist_ok=True)
-
-        #
-        logging.basicConfig(
-            level=logging.INFO if not self.debug else logging.DEBUG,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(f'logs/earnings_scraper_{datetime.now().strftime("%Y%m%d")}.log'),
-                logging.StreamHandler()
-            ]
-        )
-
-        logger = logging.getLogger(__name__)
-        logger.info("Earnings scraper initialized")
-        return logger
-
-    def initialize_driver(self):
-        """
-        this is where the magic happens...
-
-        """
-        try:
-            self.logger.info("!!! Initializing WebDriver with stealth configuration !!!")
-
-            #
-            options = AntiDetectionSystem.get_stealth_chrome_options()
-
-            if self.headless:
-                options.add_argument("--headless")
-                self.logger.info("Running in headless mode")
-
-            # init driver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-            self.wait = WebDriverWait(self.driver, 15)
-
-            #stealth scripts to remove webdriver traces
-            stealth_js = """
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined,
-            });
-
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5],
-            });
-
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en'],
-            });
-
-            window.chrome = {
-                runtime: {},
-            };
-            """
-
-            self.driver.execute_script(stealth_js)
-
-            self.logger.info("WebDriver initialized successfully with anti-detection measures")
-            self.session_stats['start_time'] = datetime.now()
-
-        except Exception as e:
-            self.logger.error(f"Failed to initialize WebDriver: {e}")
-            raise
-
-    def scrape_yahoo_earnings_calendar(self, target_date: str) -> List[EarningsEvent]:
-        """
-        core calendar scraper
-        """
-        events = []
-        url = f"https://finance.yahoo.com/calendar/earnings?from={target_date}&to={target_date}&size=100"
-
-        try:
-            self.logger.info(f"Scraping Yahoo Finance earnings calendar for {target_date}")
-            self.logger.debug(f"URL: {url}")
-
-            #
-            self.driver.get(url)
-            AntiDetectionSystem.human_like_delay(2, 4)
-
-            #
-            self.logger.debug("!!! Waiting for earnings calendar table to load...")
-
-            # in case Yahoo changes their HTML...
-            table_selectors = [
-                "table[data-test='earnings-calendar-table']",
-                "table",
-                "[data-testid='earnings-table']",
-                ".earnings-table"
-            ]
-
-            earnings_table = None
-            for selector in table_selectors:
-                try:
-                    earnings_table = self.wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    self.logger.debug(f"!!! Found table using selector: {selector}")
-                    break
-                except TimeoutException:
-                    continue
-
-            if not earnings_table:
-                self.logger.warning("!!! Could not find earnings table with any known selector")
-                return events
-
-            # extracting table rows
-            rows = earnings_table.find_elements(By.TAG_NAME, "tr")
-            self.logger.info(f"Found {len(rows)} rows in earnings table")
-
-            #
-            data_rows = rows[1:] if len(rows) > 1 else []
-
-            for i, row in enumerate(data_rows):
-                try:
-                    event = self._parse_earnings_row(row, target_date)
-                    if event:
-                        events.append(event)
-                        self.logger.debug(f"Successfully parsed: {event.symbol} - {event.company_name}")
-
-                except Exception as e:
-                    self.logger.warning(f"Failed to parse row {i}: {e}")
-                    self.session_stats['errors_encountered'] += 1
-                    continue
-
-            self.logger.info(f"Successfully extracted {len(events)} earnings events")
-            self.session_stats['pages_scraped'] += 1
-            self.session_stats['events_found'] += len(events)
-
-            # imp!!! random mouse movement
-            AntiDetectionSystem.random_mouse_movement(self.driver)
-
-        except TimeoutException:
-            self.logger.error(f"Timeout waiting for earnings calendar page to load for {target_date}")
-        except Exception as e:
-            self.logger.error(f"Unexpected error scraping {target_date}: {e}")
-            self.session_stats['errors_encountered'] += 1
-
-        return events
-
-    def _parse_earnings_row(self, row, date: str) -> Optional[EarningsEvent]:
-        try:
-            cells = row.find_elements(By.TAG_NAME, "td")
-
-            if len(cells) < 4:  #at least symbol, time, eps, revenue
-                return None
-
-            # symbol and company name
-            symbol_cell = cells[0]
-            symbol = symbol_cell.text.strip()
-
-            if not symbol:
-                return None
-
-            # fetching company name from link title or nearby elements
-            company_name = symbol  # fallback
-            try:
-                company_link = symbol_cell.find_element(By.TAG_NAME, "a")
-                company_name = (
-                        company_link.get_attribute("title") or
-                        company_link.get_attribute("aria-label") or
-                        symbol
-                )
-            except:
-                pass
-
-            # earnings time (BMO = Before Market Open, AMC = After Market Close)
-            earnings_time = cells[1].text.strip() if len(cells) > 1 else "N/A"
-
-            # extracting EPS estimate (handle various formats)
-            eps_estimate = None
-            if len(cells) > 2:
-                eps_text = cells[2].text.strip()
-                eps_estimate = self._parse_financial_number(eps_text)
-
-            #
-            revenue_estimate = None
-            if len(cells) > 3:
-                revenue_text = cells[3].text.strip()
-                revenue_estimate = revenue_text if revenue_text != "N/A" else None
-
-            # ceate earnings event
-            event = EarningsEvent(
-                symbol=symbol,
-                company_name=company_name,
-                earnings_date=date,
-                earnings_time=earnings_time,
-                eps_estimate=eps_estimate,
-                revenue_estimate=revenue_estimate
-            )
-
-            return event
-
-        except Exception as e:
-            self.logger.debug(f"!!! Error parsing earnings row: {e}")
-            return None
-
-    def _parse_financial_number(self, text: str) -> Optional[float]:
-        """
-        parsing financial numbers in various formats
-        Handles: $1.23, (1.23), 1.23B, N/A, etc.
-        """
-        if not text or text.upper() in ['N/A', 'TBD', '--', '']:
-            return None
-
-        try:
-            #
-            cleaned = text.replace('$', '').replace(',', '').replace('(', '-').replace(')', '')
-
-            # handling multipliers
-            multiplier = 1
-            if cleaned.upper().endswith('B'):
-                multiplier = 1e9
-                cleaned = cleaned[:-1]
-            elif cleaned.upper().endswith('M'):
-                multiplier = 1e6
-                cleaned = cleaned[:-1]
-            elif cleaned.upper().endswith('K'):
-                multiplier = 1e3
-                cleaned = cleaned[:-1]
-
-            #
-            number = float(cleaned.strip()) * multiplier
-            return number
-
-        except (ValueError, AttributeError):
-            return None
-
-    def enrich_with_company_details(self, events: List[EarningsEvent], max_enrich: int = 10) -> List[EarningsEvent]:
-        """
-        extra information about the company
-        """
-        self.logger.info(f"Enriching up to {max_enrich} events with company details")
-
-        enriched = 0
-        for event in events[:max_enrich]: # has to be limited though to avoid detection
-            try:
-                self.logger.debug(f"Enriching data for {event.symbol}")
-
-                profile_url = f"https://finance.yahoo.com/quote/{event.symbol}/profile"
-                self.driver.get(profile_url)
-                AntiDetectionSystem.human_like_delay(1, 2)
-
-                # sector??
-                try:
-                    sector_element = self.driver.find_element(By.CSS_SELECTOR, "[data-test='SECTOR']")
-                    event.sector = sector_element.text.strip()
-                except NoSuchElementException:
-                    pass
-
-                # mc??
-                try:
-                    market_cap_element = self.driver.find_element(By.CSS_SELECTOR, "[data-test='MARKET_CAP-value']")
-                    event.market_cap = market_cap_element.text.strip()
-                except NoSuchElementException:
-                    pass
-
-                enriched += 1
-                AntiDetectionSystem.human_like_delay(0.5, 1.5)
-
-            except Exception as e:
-                self.logger.warning(f"Failed to enrich {event.symbol}: {e}")
-                continue
-
-        self.logger.info(f"!!! Successfully added {enriched} events")
-        return events
-
-    def run_multi_day_scrape(self, start_date: str = None, days: int = 5, enrich_data: bool = False) -> List[
-        EarningsEvent]:
-        """
-        !!!
-
-        """
-        try:
-            self.logger.info(f"Starting {days}-day earnings scraping job")
-
-            # init
-            self.initialize_driver()
-
-            # 'today' by default
-            if not start_date:
-                start_date = datetime.now().strftime("%Y-%m-%d")
-
-            current_date = datetime.strptime(start_date, "%Y-%m-%d")
-            all_events = []
-
-            #
-            for day_num in range(days):
-                date_str = current_date.strftime("%Y-%m-%d")
-                weekday = current_date.weekday()
-
-                # skipping weekends, because why?
-                if weekday < 5:  # Monday=0, Sunday=6
-                    self.logger.info(f"Scraping day {day_num + 1}/{days}: {date_str}")
-
-                    daily_events = self.scrape_yahoo_earnings_calendar(date_str)
-
-                    if daily_events:
-                        all_events.extend(daily_events)
-                        self.logger.info(f"Found {len(daily_events)} events for {date_str}")
-                    else:
-                        self.logger.info(f"No earnings events found for {date_str}")
-
-                    #
-                    if day_num < days - 1:  # Don't delay after last day
-                        AntiDetectionSystem.human_like_delay(3, 8)
-                else:
-                    self.logger.info(f"Skipping weekend: {date_str}")
-
-                current_date += timedelta(days=1)
-
-            #
-            if enrich_data and all_events:
-                self.logger.info("Enriching events with company details...")
-                all_events = self.enrich_with_company_details(all_events)
-
-            self.scraped_events = all_events
-
-            #
-            self._log_session_stats()
-
-            return all_events
-
-        except Exception as e:
-            self.logger.error(f"!!! Multi-day scraping job failed: {e}")
-            return []
-
-        finally:
-            if self.driver:
-                self.driver.quit()
-                self.logger.info("!!! WebDriver session closed!!!")
-
-    def _log_session_stats(self):
-        """logs *** """
-        if self.session_stats['start_time']:
-            duration = datetime.now() - self.session_stats['start_time']
-            self.session_stats['duration_minutes'] = duration.total_seconds() / 60
-
-        self.logger.info("=" * 50)
-        self.logger.info("SCRAPING SESSION COMPLETE")
-        self.logger.info("=" * 50)
-        self.logger.info(f"Pages scraped: {self.session_stats['pages_scraped']}")
-        self.logger.info(f"Events found: {self.session_stats['events_found']}")
-        self.logger.info(f"Errors encountered: {self.session_stats['errors_encountered']}")
-        self.logger.info(f"Duration: {self.session_stats.get('duration_minutes', 0):.1f} minutes")
-        self.logger.info(
-            f"Success rate: {(1 - self.session_stats['errors_encountered'] / max(1, self.session_stats['pages_scraped'])) * 100:.1f}%")
-
-    def save_to_json(self, filename: str = None) -> str:
-        """saving scraped data to readable json """
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"data/earnings_calendar_{timestamp}.json"
-
-        #
-        os.makedirs('data', exist_ok=True)
-
-        #
-        export_data = {
-            'metadata': {
-                'scrape_timestamp': datetime.now().isoformat(),
-                'total_events': len(self.scraped_events),
-                'session_stats': {k: v.isoformat() if isinstance(v, datetime) else v for k, v in self.session_stats.items()},
-                'version': '1.0'
-            },
-            'earnings_events': [asdict(event) for event in self.scraped_events]
-        }
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
-
-        self.logger.info(f"Data saved to {filename}")
-        return filename
-
-    def save_to_csv(self, filename: str = None) -> str:
-        """ saving to csv"""
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"data/earnings_calendar_{timestamp}.csv"
-
-        #
-        os.makedirs('data', exist_ok=True)
-
-        #
-        df = pd.DataFrame([asdict(event) for event in self.scraped_events])
-
-        #
-        if not df.empty:
-            df['has_eps_estimate'] = df['eps_estimate'].notna()
-            df['has_revenue_estimate'] = df['revenue_estimate'].notna()
-            df['earnings_day_of_week'] = pd.to_datetime(df['earnings_date']).dt.day_name()
-
-        df.to_csv(filename, index=False)
-
-        self.logger.info(f"CSV saved to {filename}")
-        return filename
-
-    def generate_summary_report(self) -> Dict:
-        """ ***"""
-        if not self.scraped_events:
-            return {"error": "No data to analyze"}
-
-        df = pd.DataFrame([asdict(event) for event in self.scraped_events])
-
-        report = {
-            'total_events': len(self.scraped_events),
-            'unique_companies': df['symbol'].nunique(),
-            'date_range': {
-                'start': df['earnings_date'].min(),
-                'end': df['earnings_date'].max()
-            },
-            'earnings_timing': df['earnings_time'].value_counts().to_dict(),
-            'events_with_eps_estimates': df['eps_estimate'].notna().sum(),
-            'events_with_revenue_estimates': df['revenue_estimate'].notna().sum(),
-            'sectors_represented': df['sector'].value_counts().to_dict() if 'sector' in df.columns else {},
-            'top_companies_by_market_cap': []
-        }
-
-        return report
-
-
-# -----------------------------------------
-def main():
-
-    print("Financial Earnings Calendar Automation System")
-    print("=" * 60)
-
-    # init
-    scraper = EarningsCalendarScraper(
-        headless=False,  # T, prod
-        debug=True
-    )
-
-    try:
-        #
-        events = scraper.run_multi_day_scrape(
-            days=1, # 1 def, abeg
-            enrich_data=False  #
-        )
-
-        if events:
-            print(f"\nSuccessfully scraped {len(events)} earnings events!")
-
-            json_file = scraper.save_to_json()
-            csv_file = scraper.save_to_csv()
-
-            report = scraper.generate_summary_report()
-            print(f"\n SUMMARY REPORT:")
-            print(f"Total events: {report['total_events']}")
-            print(f"Unique companies: {report['unique_companies']}")
-            print(f"Date range: {report['date_range']['start']} to {report['date_range']['end']}")
-
-            #
-            print(f"\n SAMPLE EVENTS:")
-            for i, event in enumerate(events[:5]):
-                print(f"{i + 1}. {event.symbol} ({event.company_name}) - {event.earnings_date} {event.earnings_time}")
-
-            print(f"\n Files saved:")
-            print(f"   JSON: {json_file}")
-            print(f"   CSV: {csv_file}")
-
-        else:
-            print(" No earnings events found. Check logs for details.")
-
-    except Exception as e:
-        print(f" Scraping failed: {e}")
-
-    print("\n Scraping complete!")
-
-
-if __name__ == "__main__":
+# 541
+
+"""
+TODO:
+1. anti-detection measures
+2. robust error handling
+3. data processing and export
+4. logging and monitoring
+5. ??
+
+"""
+
+import os, re, json, csv, random, logging, time, tempfile, asyncio, queue, sqlite3, threading, atexit, functools
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # C-accelerated json, ~5-10x faster on big event lists
+except ImportError:
+    orjson = None
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict
+from dataclasses import dataclass, asdict
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    WebDriverException,
+    ElementNotInteractableException,
+    InvalidSessionIdException
+)
+from selenium.webdriver.chrome.service import Service
+
+# NB: heavy/optional deps (webdriver_manager, aiohttp, selectolax, pandas) are
+# imported lazily inside the functions that use them -- importing this module
+# for EarningsEvent or the export helpers shouldn't pay for a browser stack.
+# selenium itself stays top-level: its exception types appear in except
+# clauses throughout the file.
+
+
+# yahoo embeds its store state as a JS assignment in the page source
+_APP_MAIN_RE = re.compile(r"root\.App\.main\s*=\s*(\{.*?\});\n", re.S)
+
+
+# financial-number shapes: $1.23, (1.23), 1.23B, 4,500K ...
+_NUM_RE = re.compile(r'^\s*(\()?\s*\$?\s*(-?[\d,]*\.?\d+)\s*([BMK]?)\s*\)?\s*$', re.I)
+_MULT = {"": 1, "K": 1e3, "M": 1e6, "B": 1e9}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_financial_number(text: str) -> Optional[float]:
+    """
+    one regex match + dict lookup instead of a chain of replace()/endswith()
+    allocations; cached because cell values repeat heavily across days
+    ("N/A", "--", "0.25", ...)
+    """
+    if not text:
+        return None
+
+    m = _NUM_RE.match(text)
+    if not m:
+        return None
+
+    try:
+        number = float(m.group(2).replace(",", "")) * _MULT[m.group(3).upper()]
+    except ValueError:
+        return None
+
+    # accounting negatives: (1.23) means -1.23
+    return -number if m.group(1) else number
+
+
+# resolved chromedriver path persisted across runs -- ChromeDriverManager
+# phones home for a version check even on a warm install, which costs a
+# network round-trip per process. set EARNINGS_REFRESH_DRIVER=1 to force
+# a re-resolve (e.g. after a chrome upgrade)
+_DRIVER_PATH_FILE = os.path.join(os.path.expanduser("~"), ".cache", "earnings_scraper", "chromedriver")
+
+
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """
+    resolve chromedriver once per process, and remember the answer on disk
+    so later runs skip webdriver_manager entirely
+    """
+    if os.environ.get("EARNINGS_REFRESH_DRIVER") != "1":
+        try:
+            with open(_DRIVER_PATH_FILE) as f:
+                cached = f.read().strip()
+            if cached and os.path.isfile(cached):
+                return cached
+        except OSError:
+            pass
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+
+    try:
+        os.makedirs(os.path.dirname(_DRIVER_PATH_FILE), exist_ok=True)
+        with open(_DRIVER_PATH_FILE, "w") as f:
+            f.write(path)
+    except OSError:
+        pass  # cache miss next run, nothing worse
+
+    return path
+
+
+def _get_service() -> Service:
+    """fresh Service per driver, but against the cached chromedriver path"""
+    return Service(_chromedriver_path(), log_output=os.devnull)
+
+
+@dataclass(slots=True)
+class EarningsEvent:
+    """
+    data structure for earnings events
+    using dataclass for clean, type-safe data handling
+    slots=True: no per-instance __dict__, so thousands of events in memory
+    cost a fraction of the RSS and attribute reads are faster
+    """
+    symbol: str
+    company_name: str
+    earnings_date: str
+    earnings_time: str  # "BMO", "AMC", or specific time
+    eps_estimate: Optional[float] = None
+    revenue_estimate: Optional[str] = None
+    market_cap: Optional[str] = None
+    sector: Optional[str] = None
+    scraped_timestamp: Optional[str] = None
+
+    # batch timestamp (plain class attr, not a field): set once per ingest
+    # batch so stragglers built without an explicit ts don't each pay a
+    # datetime.now() syscall + format
+    _batch_ts = None
+
+    def __post_init__(self):
+        """add timestamp when object is created """
+        if not self.scraped_timestamp:
+            self.scraped_timestamp = EarningsEvent._batch_ts or datetime.now().isoformat()
+
+    @classmethod
+    def set_batch_timestamp(cls, ts: Optional[str] = None) -> str:
+        """stamp the start of an ingest batch; returns the value for injection"""
+        cls._batch_ts = ts or datetime.now().isoformat(timespec='seconds')
+        return cls._batch_ts
+
+
+@dataclass(slots=True)
+class PageContext:
+    """
+    per-page-load DOM facts (dimensions, body element, its center) -- stable
+    until the next navigation, so capture them once instead of re-querying
+    the browser on every helper call
+    """
+    width: int
+    height: int
+    body: object
+    center_x: float
+    center_y: float
+
+    @classmethod
+    def capture(cls, driver) -> "PageContext":
+        """one RPC, right after driver.get()
+
+        rule of thumb for this file: never issue two consecutive
+        execute_script (or find_element) calls without a DOM change in
+        between -- each round-trip to chromedriver is ~14ms, and anything
+        two scripts can see, one script can return. here the script hands
+        back document.body itself, so the old find_element call is gone.
+        """
+        width, height, cx, cy, body = driver.execute_script(
+            "const b = document.body, r = b.getBoundingClientRect();"
+            "return [b.scrollWidth, b.scrollHeight,"
+            "        r.left + r.width / 2, r.top + r.height / 2, b];"
+        )
+        return cls(width=width, height=height, body=body, center_x=cx, center_y=cy)
+
+
+class AntiDetectionSystem:
+    """
+    scraper looks and "acts" humaan
+    """
+
+    # private generator: module-level random.* goes through a shared global
+    # instance (and its lock) -- hot loops here don't need to contend on it
+    _rng = random.Random()
+
+    # real browser user agents (tuple: immutable, built once)
+    USER_AGENTS = (
+        "Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
+    )
+
+    # invariant flags, assembled once at import -- building K pool drivers only
+    # pays for the per-driver bits (scratch dirs, UA, window size)
+    _BASE_ARGS = (
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-blink-features=AutomationControlled",
+        "--disable-gpu",
+        "--disable-software-rasterizer",
+        # no --remote-debugging-port here: a fixed port can only be bound by
+        # one chrome at a time, which deadlocks the driver pool / mp workers
+        "--disable-extensions",
+        "--disable-plugins",
+        "--disable-web-security",
+        "--allow-running-insecure-content",
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding",
+        "--disable-ipc-flooding-protection",
+        "--memory-pressure-off",
+        "--max_old_space_size=4096",
+        "--disable-default-apps",
+        "--disable-sync",
+        # each of these shaves startup time / tens of MB per driver, which
+        # compounds across a pool
+        "--disable-background-networking",
+        "--disable-translate",
+        "--metrics-recording-only",
+        "--mute-audio",
+        "--no-first-run",
+        "--disable-features=Translate,BackForwardCache,MediaRouter,TranslateUI",
+    )
+
+    # common desktop resolutions, randomized per driver for fingerprint variance
+    _WINDOW_SIZES = ("1920,1080", "1680,1050", "1600,900", "1536,864")
+
+    @classmethod
+    def get_stealth_chrome_options(cls, lean: bool = True) -> ChromeOptions:
+        """
+        lean=True (default) strips images/stylesheets/fonts -- the calendar
+        scrape only reads table text. pass lean=False for paths (enrichment)
+        that may depend on CSS-driven rendering
+        """
+        options = ChromeOptions()
+
+        # return from driver.get() on DOMContentLoaded instead of waiting for
+        # every tracking pixel -- our explicit waits gate on the actual elements
+        options.page_load_strategy = "eager"
+
+        for arg in cls._BASE_ARGS:
+            options.add_argument(arg)
+
+        options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
+        options.add_experimental_option('useAutomationExtension', False)
+
+        prefs = {"profile.default_content_setting_values.notifications": 2}
+        if lean:
+            # pages are typically 3-5MB of assets we never look at
+            prefs.update({
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+            })
+            options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", prefs)
+
+        # per-driver bits below
+        temp_dir = tempfile.mkdtemp()
+        options.add_argument(f"--user-data-dir={temp_dir}")
+        options.add_argument(f"--data-path={temp_dir}")
+        options.add_argument(f"--disk-cache-dir={temp_dir}")
+
+        options.add_argument(f"--window-size={cls._rng.choice(cls._WINDOW_SIZES)}")
+
+        # random user agent
+        user_agent = cls._rng.choice(cls.USER_AGENTS)
+        options.add_argument(f'--user-agent={user_agent}')
+
+        return options
+
+    @staticmethod
+    def human_like_delay(min_seconds: float = 0.5, max_seconds: float = 3.0):
+        """
+        random delays that mimic human reading/thinking time
+        NOTE: off the hot path now -- use wait_for_ready + small_jitter there
+
+        """
+        delay = AntiDetectionSystem._rng.uniform(min_seconds, max_seconds)
+        time.sleep(delay)
+
+    # asset patterns that never matter for text extraction
+    BLOCKED_URL_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg",
+        "*.woff", "*.woff2", "*.ttf",
+        "*.mp4", "*.webm",
+        "*googletagmanager*", "*doubleclick*", "*google-analytics*",
+    ]
+
+    @classmethod
+    def apply_network_blocking(cls, driver):
+        """
+        CDP-level blocking of images/fonts/media/trackers -- biggest single
+        bandwidth win for selenium scraping, typically 2-5x faster page loads
+        """
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": cls.BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            logging.getLogger(__name__).debug("CDP network blocking unavailable: %s", e)
+
+    @staticmethod
+    async def human_like_delay_async(min_seconds: float = 0.05, max_seconds: float = 0.5):
+        """
+        async twin of human_like_delay -- a time.sleep inside a coroutine
+        would block the whole event loop and serialize every 'parallel' date
+        """
+        await asyncio.sleep(AntiDetectionSystem._rng.uniform(min_seconds, max_seconds))
+
+    @staticmethod
+    def small_jitter():
+        """tiny post-action jitter; the fixed multi-second sleeps were pure wall-time waste"""
+        time.sleep(AntiDetectionSystem._rng.uniform(0.05, 0.2))
+
+    @staticmethod
+    def wait_for_ready(driver, locator=None, timeout: float = 5):
+        """
+        condition-based wait instead of sleeping a guessed number of seconds:
+        returns as soon as the document (and optionally a specific element) is there
+        """
+        try:
+            WebDriverWait(driver, timeout).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+            if locator:
+                WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+            return True
+        except TimeoutException:
+            return False
+
+    @staticmethod
+    def wait_for_animation_end(driver, timeout: float = 3):
+        """block until css/js animations settle (no-op if none are running)"""
+        try:
+            driver.set_script_timeout(timeout)
+            driver.execute_async_script(
+                "const cb = arguments[arguments.length - 1];"
+                "Promise.all(document.getAnimations().map(a => a.finished))"
+                ".then(() => cb(true), () => cb(false));"
+            )
+        except (TimeoutException, WebDriverException):
+            pass
+
+    # dispatches precomputed mousemove points in one shot inside the browser
+    _MOUSE_MOVE_JS = """
+        const points = arguments[0];
+        for (const p of points) {
+            const el = document.elementFromPoint(p.x, p.y);
+            (el || document).dispatchEvent(new MouseEvent('mousemove', {
+                clientX: p.x, clientY: p.y, bubbles: true
+            }));
+        }
+    """
+
+    @staticmethod
+    def random_mouse_movement(driver, ctx: Optional[PageContext] = None):
+        """
+        move mouse randomly to simulate human behavior
+        points are precomputed in python and dispatched as MouseEvents in one
+        execute_script -- the old ActionChains version cost ~10 round-trips
+        per gesture and leaned on a private selenium API
+
+        """
+        try:
+            # dimensions are per-page-load constants; only hit the browser
+            # when the caller didn't hand us a captured context
+            if ctx is None:
+                ctx = PageContext.capture(driver)
+
+            rng = AntiDetectionSystem._rng
+            points = [
+                {"x": rng.randint(100, max(101, min(ctx.width - 100, 1200))),
+                 "y": rng.randint(100, max(101, min(ctx.height - 100, 800)))}
+                for _ in range(rng.randint(1, 3))
+            ]
+
+            driver.execute_script(AntiDetectionSystem._MOUSE_MOVE_JS, points)
+        except (NoSuchElementException, ElementNotInteractableException, WebDriverException) as e:
+            # targeted catch: a bare except here used to swallow slow failures
+            # (and KeyboardInterrupt) -- now we just skip the gesture and move on
+            logging.getLogger(__name__).debug("mouse sim skipped: %s", e)
+            return
+
+
+class PageCache:
+    """
+    sqlite-backed page cache -- earnings calendars for past dates never change,
+    so re-fetching them every run just burns bandwidth and rate limit.
+    past-dated pages are stored permanently, everything else gets a TTL
+    """
+
+    def __init__(self, path: str = ".cache/earnings.db", ttl_seconds: int = 86400):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, html TEXT, fetched_at INTEGER, permanent INTEGER)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS earnings ("
+            "symbol TEXT, date TEXT, payload BLOB, fetched_at INTEGER, "
+            "PRIMARY KEY(symbol, date))"
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT html, fetched_at, permanent FROM pages WHERE url = ?", (url,)
+        ).fetchone()
+        if not row:
+            return None
+        html, fetched_at, permanent = row
+        if not permanent and time.time() - fetched_at > self.ttl_seconds:
+            return None
+        return html
+
+    def put(self, url: str, html: str, permanent: bool = False):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)",
+            (url, html, int(time.time()), int(permanent))
+        )
+        self._conn.commit()
+
+    def get_events(self, date: str, max_age: Optional[int] = None) -> Optional[List[Dict]]:
+        """
+        row-level cache: every cached event dict for a date, or None on a
+        miss. max_age=None trusts rows forever (past dates can't change)
+        """
+        cutoff = 0 if max_age is None else int(time.time()) - max_age
+        rows = self._conn.execute(
+            "SELECT payload FROM earnings WHERE date = ? AND fetched_at > ?",
+            (date, cutoff)
+        ).fetchall()
+        if not rows:
+            return None
+
+        loads = orjson.loads if orjson is not None else json.loads
+        return [loads(r[0]) for r in rows]
+
+    def put_events(self, date: str, events: List["EarningsEvent"]):
+        """one transaction for the whole batch, keyed (symbol, date)"""
+        if orjson is not None:
+            dumps = lambda d: orjson.dumps(d)
+        else:
+            dumps = lambda d: json.dumps(d).encode('utf-8')
+
+        now = int(time.time())
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO earnings VALUES (?, ?, ?, ?)",
+            [(e.symbol, date, dumps(asdict(e)), now) for e in events]
+        )
+        self._conn.commit()
+
+
+class WebDriverPool:
+    """
+    K drivers built once and reused -- chrome cold-start is ~2-5s, paying it
+    per scrape is the single biggest startup tax. acquire() hands a driver out,
+    wipes cookies/localStorage on the way back so jobs don't leak state
+    """
+
+    def __init__(self, pool_size: int = 2, headless: bool = True):
+        self.size = pool_size
+        self.headless = headless
+        self.logger = logging.getLogger(__name__)
+        self._pool: "queue.Queue[webdriver.Chrome]" = queue.Queue(maxsize=pool_size)
+
+        for _ in range(pool_size):
+            self._pool.put(self._build_driver())
+
+        self.logger.info(f"WebDriver pool ready with {pool_size} drivers")
+
+    def _build_driver(self) -> webdriver.Chrome:
+        options = AntiDetectionSystem.get_stealth_chrome_options()
+        if self.headless:
+            # "new" headless is real Chrome minus the window -- same DOM as
+            # headful, roughly half the CPU/memory of running with a display
+            options.add_argument("--headless=new")
+
+        driver = webdriver.Chrome(service=_get_service(), options=options)
+        AntiDetectionSystem.apply_network_blocking(driver)
+        self._widen_http_pool(driver)
+        return driver
+
+    @staticmethod
+    def _widen_http_pool(driver, maxsize: int = 32):
+        """
+        selenium's default urllib3 pool holds a single connection -- with
+        parallel workers that serializes commands and spams "connection pool
+        is full" warnings. widen it to match the concurrency budget
+        """
+        try:
+            import urllib3
+            driver.command_executor._conn = urllib3.PoolManager(maxsize=maxsize, block=False)
+        except Exception as e:
+            logging.getLogger(__name__).debug("could not widen urllib3 pool: %s", e)
+
+    @contextmanager
+    def acquire(self):
+        """check a driver out, clean it up before it goes back in the queue"""
+        driver = self._pool.get()
+        try:
+            yield driver
+        finally:
+            try:
+                driver.delete_all_cookies()
+                driver.execute_script("window.localStorage.clear();")
+            except WebDriverException:
+                # dead session -> replace it rather than poisoning the pool
+                if driver.session_id is None:
+                    self.logger.warning("!!! Dead driver detected, replacing it")
+                    try:
+                        driver.quit()
+                    except WebDriverException:
+                        pass
+                    driver = self._build_driver()
+            self._pool.put(driver)
+
+    def _run_job(self, fn, item):
+        thread_name = threading.current_thread().name
+        with self.acquire() as driver:
+            self.logger.info(f"[{thread_name}] scraping {item}")
+            return fn(driver, item)
+
+    def map(self, fn, items: List) -> List:
+        """
+        fn(driver, item) across the pool, one worker thread per driver --
+        scraping is network-bound and webdriver RPCs release the GIL, so
+        throughput scales roughly linearly with pool size
+        """
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(lambda item: self._run_job(fn, item), items))
+
+    def shutdown(self):
+        """quit every driver; pool is unusable afterwards"""
+        while not self._pool.empty():
+            try:
+                self._pool.get_nowait().quit()
+            except (queue.Empty, WebDriverException):
+                pass
+        self.logger.info("WebDriver pool shut down")
+
+
+class AsyncFetcher:
+    """
+    fast path: most earnings pages are plain HTML/JSON, no browser needed
+    aiohttp fetches N symbols concurrently, selectolax (C-backed) does the parsing
+    selenium stays around only as the fallback for pages that actually need JS
+    """
+
+    QUOTE_URL = "https://finance.yahoo.com/quote/{symbol}"
+
+    def __init__(self, concurrency: int = 20, timeout: float = 15.0):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+
+    def _headers(self) -> Dict[str, str]:
+        # same UA pool as the selenium path
+        return {"User-Agent": random.choice(AntiDetectionSystem.USER_AGENTS)}
+
+    async def _fetch_one(self, session: "aiohttp.ClientSession", symbol: str) -> Dict:
+        import aiohttp
+
+        url = self.QUOTE_URL.format(symbol=symbol)
+        try:
+            async with session.get(url, headers=self._headers()) as response:
+                body = await response.text()
+                return {"symbol": symbol, "status": response.status, "body": body}
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.warning("async fetch failed for %s: %s", symbol, e)
+            return {"symbol": symbol, "status": None, "body": None}
+
+    async def fetch_all(self, symbols: List[str]) -> List[Dict]:
+        """fetch every symbol concurrently over one TCP pool"""
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            tasks = [self._fetch_one(session, symbol) for symbol in symbols]
+            return await asyncio.gather(*tasks)
+
+    async def stream_events(self, symbols: List[str], parse_callback) -> List[EarningsEvent]:
+        """
+        events stream out as fetches complete (asyncio.as_completed) instead of
+        waiting for the whole batch; parse_callback(symbol, body) -> Optional[EarningsEvent]
+        """
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        events: List[EarningsEvent] = []
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            tasks = [self._fetch_one(session, symbol) for symbol in symbols]
+            for future in asyncio.as_completed(tasks):
+                result = await future
+                if not result["body"]:
+                    continue
+                event = parse_callback(result["symbol"], result["body"])
+                if event:
+                    events.append(event)
+
+        return events
+
+    @staticmethod
+    def needs_js(body: str) -> bool:
+        """true when static HTML came back without the data -> selenium fallback"""
+        from selectolax.parser import HTMLParser
+
+        tree = HTMLParser(body)
+        return tree.css_first("table") is None
+
+    def run(self, symbols: List[str]) -> List[Dict]:
+        """sync entry point for callers that aren't async themselves"""
+        return asyncio.run(self.fetch_all(symbols))
+
+
+# --- multiprocessing enrichment workers --------------------------------------
+# selenium doesn't play well with threads, so the enrichment fan-out uses a
+# process pool where every worker owns one long-lived stealth driver
+_worker_driver = None
+
+
+def _init_worker(headless: bool = True):
+    global _worker_driver
+
+    # lean=False: profile pages may need CSS for sector/market-cap extraction
+    options = AntiDetectionSystem.get_stealth_chrome_options(lean=False)
+    if headless:
+        options.add_argument("--headless=new")
+
+    _worker_driver = webdriver.Chrome(service=_get_service(), options=options)
+    AntiDetectionSystem.apply_network_blocking(_worker_driver)
+    atexit.register(_quit_worker_driver)
+
+
+def _quit_worker_driver():
+    global _worker_driver
+    if _worker_driver is not None:
+        try:
+            _worker_driver.quit()
+        except WebDriverException:
+            pass
+        _worker_driver = None
+
+
+def _enrich_one(event: EarningsEvent) -> EarningsEvent:
+    """fetch sector / market cap for one symbol on this worker's driver"""
+    driver = _worker_driver
+    if driver is None:
+        return event
+
+    try:
+        driver.get(f"https://finance.yahoo.com/quote/{event.symbol}/profile")
+        AntiDetectionSystem.wait_for_ready(driver)
+
+        try:
+            event.sector = driver.find_element(
+                By.CSS_SELECTOR, "[data-test='SECTOR']").text.strip()
+        except NoSuchElementException:
+            pass
+
+        try:
+            event.market_cap = driver.find_element(
+                By.CSS_SELECTOR, "[data-test='MARKET_CAP-value']").text.strip()
+        except NoSuchElementException:
+            pass
+    except WebDriverException:
+        pass
+
+    return event
+
+
+class EarningsCalendarScraper:
+    """
+    gathers real-world financial data
+
+    """
+
+    # flush the event stream every K rows
+    _STREAM_FLUSH_EVERY = 50
+
+    def __init__(self, headless: bool = True, debug: bool = False, use_cache: bool = True,
+                 stream_path: Optional[str] = None, lean_mode: bool = True):
+        self.headless = headless
+        self.debug = debug
+        self.lean_mode = lean_mode
+        self.driver = None
+        self.wait = None
+        self.page_cache = PageCache() if use_cache else None
+        self.stream_path = stream_path
+        self._stream_file = None
+        self._stream_count = 0
+        self._df_cache = None
+        self._df_cache_key = None
+        self.logger = self._setup_logging()
+        self.scraped_events: List[EarningsEvent] = []
+        self.session_stats = {
+            'pages_scraped': 0,
+            'events_found': 0,
+            'errors_encountered': 0,
+            'start_time': None
+        }
+
+    def _setup_logging(self) -> logging.Logger:
+        """
+        cnfigure comprehensive logging
+        """
+        #
+        os.makedirs('logs', exist_ok=True)
+
+        #
+        logging.basicConfig(
+            level=logging.INFO if not self.debug else logging.DEBUG,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler(f'logs/earnings_scraper_{datetime.now().strftime("%Y%m%d")}.log'),
+                logging.StreamHandler()
+            ]
+        )
+
+        # even in debug mode we don't want selenium/urllib3 wire logs: every
+        # WebDriver RPC logs its full request/response payload at DEBUG, which
+        # dwarfs our own output and costs real time formatting it
+        logging.getLogger("selenium").setLevel(logging.WARNING)
+        logging.getLogger("urllib3").setLevel(logging.WARNING)
+
+        logger = logging.getLogger(__name__)
+        logger.info("Earnings scraper initialized")
+        return logger
+
+    def initialize_driver(self):
+        """
+        this is where the magic happens...
+
+        """
+        # a live session is worth 2-5s of chrome startup -- don't respin it
+        if self.driver is not None and getattr(self.driver, 'session_id', None):
+            self.logger.debug("Reusing live WebDriver session")
+            return
+
+        try:
+            self.logger.info("!!! Initializing WebDriver with stealth configuration !!!")
+
+            #
+            options = AntiDetectionSystem.get_stealth_chrome_options(lean=self.lean_mode)
+
+            if self.headless:
+                options.add_argument("--headless=new")
+                self.logger.info("Running in headless (new) mode")
+
+            # init driver (chromedriver path is cached for the process)
+            self.driver = webdriver.Chrome(service=_get_service(), options=options)
+            self.wait = WebDriverWait(self.driver, 15)
+
+            #stealth scripts to remove webdriver traces
+            stealth_js = """
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined,
+            });
+
+            Object.defineProperty(navigator, 'plugins', {
+                get: () => [1, 2, 3, 4, 5],
+            });
+
+            Object.defineProperty(navigator, 'languages', {
+                get: () => ['en-US', 'en'],
+            });
+
+            window.chrome = {
+                runtime: {},
+            };
+            """
+
+            self.driver.execute_script(stealth_js)
+
+            # block heavy assets at the CDP level too
+            AntiDetectionSystem.apply_network_blocking(self.driver)
+
+            # selenium's default urllib3 pool is a single connection; widen it
+            # so parallel enrichment / async watchers can overlap commands
+            WebDriverPool._widen_http_pool(self.driver, maxsize=16)
+
+            self.logger.info("WebDriver initialized successfully with anti-detection measures")
+            self.session_stats['start_time'] = datetime.now()
+
+        except Exception as e:
+            self.logger.error(f"Failed to initialize WebDriver: {e}")
+            raise
+
+    def _open_stream(self):
+        """open the ndjson stream if a path was configured"""
+        if self.stream_path and not self._stream_file:
+            os.makedirs(os.path.dirname(self.stream_path) or ".", exist_ok=True)
+            self._stream_file = open(self.stream_path, 'ab')
+            self._stream_count = 0
+            self.logger.info(f"Streaming events to {self.stream_path}")
+
+    def _stream_event(self, event: EarningsEvent):
+        """
+        append one event to the stream as it's scraped -- peak memory stays
+        O(1) instead of accumulating everything before a final dump
+        """
+        if not self._stream_file:
+            return
+        payload = asdict(event)
+        if orjson is not None:
+            self._stream_file.write(orjson.dumps(payload))
+        else:
+            self._stream_file.write(json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+        self._stream_file.write(b"\n")
+        self._stream_count += 1
+        if self._stream_count % self._STREAM_FLUSH_EVERY == 0:
+            self._stream_file.flush()
+
+    def _close_stream(self):
+        if self._stream_file:
+            self._stream_file.close()
+            self._stream_file = None
+
+    def _navigate_cdp(self, url: str, target_selector: Optional[str] = None, timeout: float = 15) -> bool:
+        """
+        navigate over CDP instead of the full w3c driver.get() semantics --
+        we poll readiness ourselves and call Page.stopLoading the moment the
+        element we actually need exists, instead of waiting out the tail of
+        ads/beacons. falls back to driver.get when CDP isn't available
+        """
+        try:
+            # sentinel on the *current* document: the driver is reused across
+            # dates, so right after Page.navigate the probe below still sees
+            # the previous page (readyState complete, old table present).
+            # the fresh document won't carry the token, so its absence is the
+            # signal that navigation actually committed
+            self.driver.execute_script("window.__navToken = 1")
+            self.driver.execute_cdp_cmd("Page.enable", {})
+            self.driver.execute_cdp_cmd("Page.navigate", {"url": url})
+        except WebDriverException as e:
+            self.logger.debug("CDP navigation unavailable, using driver.get: %s", e)
+            self.driver.get(url)
+            return True
+
+        selector_js = (
+            f"!!document.querySelector({json.dumps(target_selector)})"
+            if target_selector else "false"
+        )
+        probe = (
+            "return [window.__navToken === undefined,"
+            f" document.readyState, {selector_js}]"
+        )
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                committed, ready_state, has_target = self.driver.execute_script(probe)
+            except WebDriverException:
+                time.sleep(0.05)
+                continue
+
+            if not committed:
+                # still looking at the old document -- anything it reports
+                # (including its leftover table) is about the wrong page
+                time.sleep(0.05)
+                continue
+
+            if has_target:
+                # got what we came for -- abandon the rest of the page load
+                try:
+                    self.driver.execute_cdp_cmd("Page.stopLoading", {})
+                except WebDriverException:
+                    pass
+                return True
+            if ready_state == "complete":
+                return True
+
+            time.sleep(0.05)
+
+        self.logger.warning(f"CDP navigation timed out after {timeout}s: {url}")
+        return False
+
+    CALENDAR_URL = "https://finance.yahoo.com/calendar/earnings"
+
+    # in case Yahoo changes their HTML...
+    TABLE_SELECTORS = (
+        "table[data-test='earnings-calendar-table']",
+        "table",
+        "[data-testid='earnings-table']",
+        ".earnings-table",
+    )
+
+    # expected-condition callables built once at class creation -- the serial
+    # fallback shouldn't re-allocate a closure + locator tuple per call
+    _TABLE_WAITERS = tuple(
+        EC.presence_of_element_located((By.CSS_SELECTOR, s)) for s in TABLE_SELECTORS
+    )
+
+    # polls every selector in the browser, resolves with the first match
+    _SELECTOR_POLL_JS = """
+        const cb = arguments[arguments.length - 1];
+        const sels = arguments[0];
+        const deadline = Date.now() + arguments[1];
+        (function poll() {
+            for (const s of sels) {
+                if (document.querySelector(s)) { cb(s); return; }
+            }
+            if (Date.now() > deadline) { cb(null); return; }
+            setTimeout(poll, 100);
+        })();
+    """
+
+    def _wait_for_any_selector(self, selectors, timeout: float = 15) -> Optional[str]:
+        """
+        one in-browser poll across all selectors at once -- the old serial
+        WebDriverWait loop could stack 4 x 15s of timeouts on a miss
+        """
+        try:
+            self.driver.set_script_timeout(timeout + 1)
+            return self.driver.execute_async_script(
+                self._SELECTOR_POLL_JS, list(selectors), int(timeout * 1000)
+            )
+        except (TimeoutException, WebDriverException) as e:
+            self.logger.debug("async selector poll failed, serial fallback: %s", e)
+            # serial fallback runs the precompiled waiters with a short budget:
+            # the JS poll and this path are mutually exclusive, so 5s per
+            # selector bounds the worst case at 20s instead of 60s
+            fallback_wait = WebDriverWait(self.driver, 5)
+            for selector, waiter in zip(self.TABLE_SELECTORS, self._TABLE_WAITERS):
+                try:
+                    fallback_wait.until(waiter)
+                    return selector
+                except TimeoutException:
+                    continue
+            return None
+
+    def _ensure_driver(self):
+        """driver startup is lazy -- only pay for Chrome when a fallback needs it"""
+        if self.driver is None:
+            self.initialize_driver()
+        else:
+            self._ensure_alive()
+
+    def _ensure_alive(self):
+        """
+        probe the cached session; on a dead one, re-init instead of crashing.
+        between dates we just clear cookies -- a restart costs chrome startup,
+        a cookie wipe costs one RPC
+        """
+        try:
+            if self.driver.session_id is None:
+                raise InvalidSessionIdException("session_id is None")
+            self.driver.delete_all_cookies()
+        except (InvalidSessionIdException, WebDriverException):
+            self.logger.warning("WebDriver session lost, re-initializing")
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                pass
+            self.driver = None
+            self.initialize_driver()
+
+    def _try_static(self, target_date: str) -> Optional[List[EarningsEvent]]:
+        """
+        fast path: one plain-HTTP GET, no browser. tries the embedded store
+        JSON first, then a static parse of the server-rendered table from the
+        same response -- selenium only runs if both miss (4xx/5xx, empty
+        parse, or a JS-only page)
+        """
+        import requests
+
+        try:
+            resp = requests.get(
+                self.CALENDAR_URL,
+                params={"from": target_date, "to": target_date, "day": target_date, "size": 100},
+                headers={"User-Agent": AntiDetectionSystem._rng.choice(AntiDetectionSystem.USER_AGENTS)},
+                timeout=10,
+            )
+            resp.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.debug("static fetch failed for %s: %s", target_date, e)
+            return None
+
+        rows = self._rows_from_calendar_html(resp.text)
+        if rows is not None:
+            return self._events_from_json_rows(rows, target_date)
+
+        # no store blob -- the table may still be server-rendered, so parse
+        # the html we already paid for before giving up on the cheap path
+        events = self._events_from_html(resp.text, target_date)
+        if not events:
+            self.logger.debug("static parse empty for %s, falling back to selenium", target_date)
+            return None
+        return events
+
+    @staticmethod
+    def _rows_from_calendar_html(text: str) -> Optional[List[Dict]]:
+        """dig the screener rows out of the embedded store blob, None on mismatch"""
+        match = _APP_MAIN_RE.search(text)
+        if not match:
+            return None
+
+        try:
+            blob = json.loads(match.group(1))
+            return (blob["context"]["dispatcher"]["stores"]
+                        ["ScreenerResultsStore"]["results"]["rows"])
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return None
+
+    async def _scrape_date_async(self, session, semaphore, date_str: str):
+        """
+        one date on the shared session, politely gated by the semaphore;
+        returns (date, events) or (date, None) when the fast path missed
+        """
+        import aiohttp
+
+        # row cache first, same policy as the sync path: past dates are
+        # trusted forever, today/future rows only within the TTL -- a re-run
+        # over an overlapping range shouldn't touch the network at all
+        if self.page_cache:
+            is_past = date_str < datetime.now().strftime("%Y-%m-%d")
+            cached_rows = self.page_cache.get_events(
+                date_str,
+                max_age=None if is_past else self.page_cache.ttl_seconds
+            )
+            if cached_rows:
+                self.logger.info(f"Row-cache hit for {date_str}: {len(cached_rows)} events")
+                return date_str, [EarningsEvent(**row) for row in cached_rows]
+
+        text = None
+        async with semaphore:
+            # keep the anti-detection jitter, but let it overlap across dates
+            await AntiDetectionSystem.human_like_delay_async()
+
+            for attempt in range(3):
+                try:
+                    async with session.get(
+                        self.CALENDAR_URL,
+                        params={"from": date_str, "to": date_str, "day": date_str, "size": 100},
+                        headers={"User-Agent": AntiDetectionSystem._rng.choice(AntiDetectionSystem.USER_AGENTS)},
+                    ) as resp:
+                        resp.raise_for_status()
+                        text = await resp.text()
+                    break
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    # manual exponential backoff with a little jitter
+                    delay = (2 ** attempt) + AntiDetectionSystem._rng.uniform(0, 0.5)
+                    self.logger.debug("retry %d for %s in %.1fs: %s", attempt + 1, date_str, delay, e)
+                    await asyncio.sleep(delay)
+
+        if text is None:
+            return date_str, None
+
+        rows = self._rows_from_calendar_html(text)
+        if rows is None:
+            return date_str, None
+
+        events = self._events_from_json_rows(rows, date_str)
+        if events and self.page_cache:
+            self.page_cache.put_events(date_str, events)
+        return date_str, events
+
+    async def _run_async(self, dates: List[str]):
+        """fan every date out over one aiohttp session, bounded per-host"""
+        import aiohttp
+
+        semaphore = asyncio.Semaphore(4)
+        connector = aiohttp.TCPConnector(limit=8)
+        timeout = aiohttp.ClientTimeout(total=15)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            tasks = [self._scrape_date_async(session, semaphore, d) for d in dates]
+            return await asyncio.gather(*tasks)
+
+    def _events_from_json_rows(self, rows: List[Dict], date: str) -> List[EarningsEvent]:
+        """build events straight from yahoo's screener rows"""
+        ts = EarningsEvent.set_batch_timestamp()
+        events = []
+
+        for row in rows:
+            try:
+                symbol = (row.get("ticker") or row.get("symbol") or "").strip()
+                if not symbol:
+                    continue
+                revenue = row.get("revenueestimate")
+                events.append(EarningsEvent(
+                    symbol=symbol,
+                    company_name=row.get("companyshortname") or symbol,
+                    earnings_date=date,
+                    earnings_time=row.get("startdatetimetype") or "N/A",
+                    eps_estimate=row.get("epsestimate"),
+                    revenue_estimate=str(revenue) if revenue is not None else None,
+                    scraped_timestamp=ts,
+                ))
+            except (TypeError, ValueError, AttributeError):
+                continue
+
+        return events
+
+    def scrape_yahoo_earnings_calendar(self, target_date: str) -> List[EarningsEvent]:
+        """
+        core calendar scraper
+        JSON endpoint first; selenium is the exception, not the rule
+        """
+        events = []
+        url = f"https://finance.yahoo.com/calendar/earnings?from={target_date}&to={target_date}&size=100"
+
+        try:
+            self.logger.info(f"Scraping Yahoo Finance earnings calendar for {target_date}")
+            self.logger.debug("URL: %s", url)
+
+            # row cache first: past dates are trusted forever, today/future
+            # rows only within the TTL
+            if self.page_cache:
+                is_past = target_date < datetime.now().strftime("%Y-%m-%d")
+                cached_rows = self.page_cache.get_events(
+                    target_date,
+                    max_age=None if is_past else self.page_cache.ttl_seconds
+                )
+                if cached_rows:
+                    events = [EarningsEvent(**row) for row in cached_rows]
+                    self.logger.info(f"Row-cache hit for {target_date}: {len(events)} events")
+                    self.session_stats['pages_scraped'] += 1
+                    self.session_stats['events_found'] += len(events)
+                    return events
+
+            # page cache next: a hit still skips the network and the browser
+            if self.page_cache:
+                cached_html = self.page_cache.get(url)
+                if cached_html is not None:
+                    events = self._events_from_html(cached_html, target_date)
+                    self.logger.info(f"Cache hit for {target_date}: {len(events)} events, no fetch needed")
+                    self.session_stats['pages_scraped'] += 1
+                    self.session_stats['events_found'] += len(events)
+                    return events
+
+            # static HTTP next (embedded JSON or server-rendered table) --
+            # still no browser involved
+            static_events = self._try_static(target_date)
+            if static_events:
+                self.logger.info(f"Static fetch: {len(static_events)} events for {target_date}")
+                self.session_stats['pages_scraped'] += 1
+                self.session_stats['events_found'] += len(static_events)
+                if self.page_cache:
+                    self.page_cache.put_events(target_date, static_events)
+                return static_events
+
+            # last resort: spin up (or reuse) the browser
+            self._ensure_driver()
+
+            # CDP navigation: bail out of the page load as soon as a table exists
+            self._navigate_cdp(url, target_selector="table")
+            AntiDetectionSystem.small_jitter()
+
+            # snapshot page-stable DOM facts once for the helpers below
+            page_ctx = PageContext.capture(self.driver)
+
+            #
+            self.logger.debug("!!! Waiting for earnings calendar table to load...")
+
+            found_selector = self._wait_for_any_selector(self.TABLE_SELECTORS)
+
+            if not found_selector:
+                self.logger.warning("!!! Could not find earnings table with any known selector")
+                return events
+
+            self.logger.debug(f"!!! Found table using selector: {found_selector}")
+
+            # one timestamp per page -- the whole batch is scraped at effectively
+            # the same instant, no point calling datetime.now() per row
+            scrape_ts = EarningsEvent.set_batch_timestamp()
+
+            # batch extraction: one execute_script returns every row as a dict,
+            # instead of O(rows * cells) webdriver round-trips
+            row_dicts = self._extract_rows_js()
+
+            if not row_dicts:
+                # no per-cell element walk anymore -- a 100-row page cost 500+
+                # chromedriver round-trips that way, and the JS pass sees the
+                # exact same DOM
+                self.logger.warning("!!! JS row extraction returned no rows")
+                return events
+
+            self.logger.info(f"Found {len(row_dicts)} rows in earnings table")
+            for i, row_dict in enumerate(row_dicts):
+                try:
+                    event = self._event_from_row_dict(row_dict, target_date, scrape_ts)
+                    if event:
+                        events.append(event)
+                        self.logger.debug("Successfully parsed: %s - %s", event.symbol, event.company_name)
+                except Exception as e:
+                    self.logger.warning("Failed to parse row %d: %s", i, e)
+                    self.session_stats['errors_encountered'] += 1
+                    continue
+
+            self.logger.info(f"Successfully extracted {len(events)} earnings events")
+            self.session_stats['pages_scraped'] += 1
+            self.session_stats['events_found'] += len(events)
+
+            # store the page and the rows; past dates never change, so the
+            # page copy lives forever
+            if self.page_cache and events:
+                is_past = target_date < datetime.now().strftime("%Y-%m-%d")
+                self.page_cache.put(url, self.driver.page_source, permanent=is_past)
+                self.page_cache.put_events(target_date, events)
+
+            # imp!!! random mouse movement
+            AntiDetectionSystem.random_mouse_movement(self.driver, page_ctx)
+
+        except TimeoutException:
+            self.logger.error(f"Timeout waiting for earnings calendar page to load for {target_date}")
+        except Exception as e:
+            self.logger.error(f"Unexpected error scraping {target_date}: {e}")
+            self.session_stats['errors_encountered'] += 1
+
+        return events
+
+    # walks the whole table inside the browser and ships one JSON blob back
+    _ROW_EXTRACT_JS = """
+        const rows = Array.from(document.querySelectorAll("table tr")).slice(1);
+        return rows.map(tr => {
+            const t = tr.querySelectorAll("td");
+            const a = t[0] ? t[0].querySelector("a") : null;
+            return {
+                symbol: t[0] ? t[0].innerText.trim() : null,
+                company: a ? (a.getAttribute("title") || a.getAttribute("aria-label")) : null,
+                time: t[1] ? t[1].innerText.trim() : null,
+                eps: t[2] ? t[2].innerText.trim() : null,
+                revenue: t[3] ? t[3].innerText.trim() : null,
+            };
+        });
+    """
+
+    def _extract_rows_js(self) -> List[Dict]:
+        """
+        single RPC for the whole page -- each find_element/.text call is a
+        ~14ms round-trip to chromedriver, so per-cell extraction dominates
+        """
+        try:
+            return self.driver.execute_script(self._ROW_EXTRACT_JS) or []
+        except WebDriverException as e:
+            self.logger.debug("JS row extraction failed: %s", e)
+            return []
+
+    def _events_from_html(self, html: str, date: str) -> List[EarningsEvent]:
+        """rebuild events from cached page html -- selectolax, no browser involved"""
+        from selectolax.parser import HTMLParser
+
+        events = []
+        ts = EarningsEvent.set_batch_timestamp()
+        tree = HTMLParser(html)
+
+        for tr in tree.css("table tr")[1:]:
+            cells = tr.css("td")
+            if len(cells) < 4:
+                continue
+            link = cells[0].css_first("a")
+            row = {
+                'symbol': cells[0].text(strip=True),
+                'company': (link.attributes.get('title') or link.attributes.get('aria-label')) if link else None,
+                'time': cells[1].text(strip=True),
+                'eps': cells[2].text(strip=True),
+                'revenue': cells[3].text(strip=True),
+            }
+            event = self._event_from_row_dict(row, date, ts)
+            if event:
+                events.append(event)
+
+        return events
+
+    def _event_from_row_dict(self, row: Dict, date: str, ts: Optional[str] = None) -> Optional[EarningsEvent]:
+        """build an event from the batched JS extraction output"""
+        symbol = (row.get('symbol') or '').strip()
+        if not symbol:
+            return None
+
+        revenue_text = row.get('revenue')
+
+        return EarningsEvent(
+            symbol=symbol,
+            company_name=row.get('company') or symbol,
+            earnings_date=date,
+            earnings_time=row.get('time') or "N/A",
+            eps_estimate=self._parse_financial_number(row.get('eps') or ''),
+            revenue_estimate=revenue_text if revenue_text and revenue_text != "N/A" else None,
+            scraped_timestamp=ts,
+        )
+
+    def _parse_financial_number(self, text: str) -> Optional[float]:
+        """
+        parsing financial numbers in various formats
+        Handles: $1.23, (1.23), 1.23B, N/A, etc. (module-level cached helper)
+        """
+        return _parse_financial_number(text)
+
+    def enrich_with_company_details(self, events: List[EarningsEvent], max_enrich: int = 10,
+                                    processes: int = 4) -> List[EarningsEvent]:
+        """
+        extra information about the company -- fanned out over a process pool,
+        one long-lived driver per worker, since the serial loop cost ~30s for
+        10 symbols and selenium can't share a driver across threads
+        """
+        import multiprocessing as mp
+
+        targets = events[:max_enrich]  # has to be limited though to avoid detection
+        if not targets:
+            return events
+
+        self.logger.info(f"Enriching up to {len(targets)} events with company details "
+                         f"({processes} workers)")
+
+        # no `with mp.Pool(...)`: the context manager terminate()s workers on
+        # exit, which kills them before their atexit hook can quit the driver
+        # and leaks a headless chrome per worker. close()+join() lets them
+        # exit through normal interpreter shutdown instead
+        pool = mp.Pool(min(processes, len(targets)),
+                       initializer=_init_worker, initargs=(self.headless,))
+        try:
+            enriched = list(pool.imap_unordered(_enrich_one, targets))
+            pool.close()
+            pool.join()
+        except Exception as e:
+            self.logger.warning(f"Parallel enrichment failed: {e}")
+            pool.terminate()
+            pool.join()
+            return events
+
+        # events come back out of order (and as copies, they crossed a process
+        # boundary) -- stitch them back in by symbol
+        by_symbol = {e.symbol: e for e in enriched}
+        for i, event in enumerate(targets):
+            events[i] = by_symbol.get(event.symbol, event)
+
+        self.logger.info(f"!!! Successfully enriched {len(enriched)} events")
+        return events
+
+    def run_multi_day_scrape(self, start_date: str = None, days: int = 5, enrich_data: bool = False) -> List[
+        EarningsEvent]:
+        """
+        !!!
+
+        """
+        try:
+            self.logger.info(f"Starting {days}-day earnings scraping job")
+
+            # driver startup no longer marks the session start -- do it here
+            if not self.session_stats['start_time']:
+                self.session_stats['start_time'] = datetime.now()
+
+            # NB: no initialize_driver() here -- chrome only starts if a date
+            # actually falls back to selenium
+            self._open_stream()
+
+            # 'today' by default
+            if not start_date:
+                start_date = datetime.now().strftime("%Y-%m-%d")
+
+            current_date = datetime.strptime(start_date, "%Y-%m-%d")
+            all_events = []
+
+            # build the weekday list up front, then fetch every date at once --
+            # the dates are independent, so serializing them was pure wall time
+            dates = []
+            for _ in range(days):
+                date_str = current_date.strftime("%Y-%m-%d")
+                if current_date.weekday() < 5:  # Monday=0, Sunday=6
+                    dates.append(date_str)
+                else:
+                    self.logger.info(f"Skipping weekend: {date_str}")
+                current_date += timedelta(days=1)
+
+            self.logger.info(f"Fetching {len(dates)} dates concurrently")
+            results = asyncio.run(self._run_async(dates))
+
+            for date_str, daily_events in results:
+                if daily_events is None:
+                    # async fast path missed -> per-date selenium fallback
+                    self.logger.info(f"Async path missed {date_str}, using selenium fallback")
+                    daily_events = self.scrape_yahoo_earnings_calendar(date_str)
+
+                if daily_events:
+                    all_events.extend(daily_events)
+                    for event in daily_events:
+                        self._stream_event(event)
+                    self.logger.info(f"Found {len(daily_events)} events for {date_str}")
+                else:
+                    self.logger.info(f"No earnings events found for {date_str}")
+
+            self.session_stats['pages_scraped'] += len([r for r in results if r[1] is not None])
+            self.session_stats['events_found'] += sum(len(r[1]) for r in results if r[1])
+
+            #
+            if enrich_data and all_events:
+                self.logger.info("Enriching events with company details...")
+                all_events = self.enrich_with_company_details(all_events)
+
+            self.scraped_events = all_events
+
+            #
+            self._log_session_stats()
+
+            return all_events
+
+        except Exception as e:
+            self.logger.error(f"!!! Multi-day scraping job failed: {e}")
+            return []
+
+        finally:
+            self._close_stream()
+            if self.driver:
+                self.driver.quit()
+                # quit() doesn't clear session_id, so drop our handles too --
+                # otherwise the reuse checks in initialize_driver/_ensure_alive
+                # mistake the dead driver for a live one on the next run
+                self.driver = None
+                self.wait = None
+                self.logger.info("!!! WebDriver session closed!!!")
+
+    def _log_session_stats(self):
+        """logs *** """
+        if self.session_stats['start_time']:
+            duration = datetime.now() - self.session_stats['start_time']
+            self.session_stats['duration_minutes'] = duration.total_seconds() / 60
+
+        self.logger.info("=" * 50)
+        self.logger.info("SCRAPING SESSION COMPLETE")
+        self.logger.info("=" * 50)
+        self.logger.info(f"Pages scraped: {self.session_stats['pages_scraped']}")
+        self.logger.info(f"Events found: {self.session_stats['events_found']}")
+        self.logger.info(f"Errors encountered: {self.session_stats['errors_encountered']}")
+        self.logger.info(f"Duration: {self.session_stats.get('duration_minutes', 0):.1f} minutes")
+        self.logger.info(
+            f"Success rate: {(1 - self.session_stats['errors_encountered'] / max(1, self.session_stats['pages_scraped'])) * 100:.1f}%")
+
+    def save_to_json(self, filename: str = None) -> str:
+        """saving scraped data to readable json """
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"data/earnings_calendar_{timestamp}.json"
+
+        #
+        os.makedirs('data', exist_ok=True)
+
+        #
+        metadata = {
+            'scrape_timestamp': datetime.now().isoformat(),
+            'total_events': len(self.scraped_events),
+            'session_stats': {k: v.isoformat() if isinstance(v, datetime) else v for k, v in self.session_stats.items()},
+            'version': '1.0'
+        }
+
+        if orjson is not None:
+            # orjson serializes dataclasses natively -- no asdict() pass, so
+            # we skip N intermediate dict allocations entirely
+            export_data = {'metadata': metadata, 'earnings_events': self.scraped_events}
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    export_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS,
+                ))
+        else:
+            export_data = {'metadata': metadata,
+                           'earnings_events': [asdict(event) for event in self.scraped_events]}
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, ensure_ascii=False)
+
+        self.logger.info(f"Data saved to {filename}")
+        return filename
+
+    def save_to_ndjson(self, filename: str = None) -> str:
+        """
+        one event per line, written as we go -- for very large batches this
+        avoids materialising the whole list before serialising
+        """
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"data/earnings_calendar_{timestamp}.ndjson"
+
+        #
+        os.makedirs('data', exist_ok=True)
+
+        with open(filename, 'wb') as f:
+            for event in self.scraped_events:
+                payload = asdict(event)
+                if orjson is not None:
+                    f.write(orjson.dumps(payload))
+                else:
+                    f.write(json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+                f.write(b"\n")
+
+        self.logger.info(f"NDJSON saved to {filename}")
+        return filename
+
+    def save_to_csv(self, filename: str = None) -> str:
+        """ saving to csv -- stdlib writer, no need to drag pandas in for this"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"data/earnings_calendar_{timestamp}.csv"
+
+        #
+        os.makedirs('data', exist_ok=True)
+
+        fieldnames = list(EarningsEvent.__dataclass_fields__) + [
+            'has_eps_estimate', 'has_revenue_estimate', 'earnings_day_of_week'
+        ]
+
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            for event in self.scraped_events:
+                row = asdict(event)
+                row['has_eps_estimate'] = event.eps_estimate is not None
+                row['has_revenue_estimate'] = event.revenue_estimate is not None
+                try:
+                    row['earnings_day_of_week'] = datetime.strptime(
+                        event.earnings_date, "%Y-%m-%d").strftime("%A")
+                except ValueError:
+                    row['earnings_day_of_week'] = None
+                writer.writerow(row)
+
+        self.logger.info(f"CSV saved to {filename}")
+
+        # parquet twin: columnar + typed, so downstream analysis re-reads in
+        # milliseconds instead of re-parsing CSV strings. best-effort only
+        try:
+            parquet_name = filename.rsplit('.', 1)[0] + '.parquet'
+            self._events_df().to_parquet(parquet_name, engine='pyarrow', compression='zstd')
+            self.logger.info(f"Parquet saved to {parquet_name}")
+        except ImportError:
+            self.logger.debug("pyarrow not installed, skipping parquet export")
+        except Exception as e:
+            self.logger.warning(f"Parquet export failed: {e}")
+
+        return filename
+
+    def _events_df(self):
+        """
+        shared DataFrame for the analytics paths -- built from a record
+        generator (no second asdict list in memory) and cached until the
+        event list changes. categoricals cut memory and make value_counts
+        several times faster
+        """
+        # lazy import: analytics is the only pandas consumer left, and pulling
+        # it in at module level costs ~0.5s + ~60MB for every invocation
+        import pandas as pd
+
+        # identity + length: run_multi_day_scrape rebinds scraped_events to a
+        # fresh list, and two runs can easily land on the same count -- length
+        # alone would silently serve the previous run's frame
+        key = (id(self.scraped_events), len(self.scraped_events))
+        if self._df_cache is None or self._df_cache_key != key:
+            df = pd.DataFrame.from_records(asdict(event) for event in self.scraped_events)
+            for col in ('symbol', 'earnings_time', 'sector'):
+                if col in df.columns:
+                    df[col] = df[col].astype('category')
+            self._df_cache = df
+            self._df_cache_key = key
+
+        return self._df_cache
+
+    def generate_summary_report(self) -> Dict:
+        """ ***"""
+        if not self.scraped_events:
+            return {"error": "No data to analyze"}
+
+        df = self._events_df()
+
+        # numeric market cap, parsed once -- ranking the raw strings would be
+        # lexicographic ("1.2B" < "500M") and therefore wrong
+        market_cap_num = df['market_cap'].map(
+            lambda v: _parse_financial_number(v) if isinstance(v, str) else None
+        ) if 'market_cap' in df.columns else None
+
+        top_by_cap = []
+        if market_cap_num is not None and market_cap_num.notna().any():
+            top_idx = market_cap_num.nlargest(10).index
+            top_by_cap = df.loc[top_idx, ['symbol', 'company_name', 'market_cap']].to_dict('records')
+
+        # each value_counts runs exactly once; sort=False skips a pointless sort
+        timing_counts = df['earnings_time'].value_counts(sort=False)
+        sector_counts = df['sector'].value_counts(sort=False) if 'sector' in df.columns else None
+
+        report = {
+            'total_events': len(self.scraped_events),
+            'unique_companies': int(df['symbol'].nunique()),
+            'date_range': {
+                'start': df['earnings_date'].min(),
+                'end': df['earnings_date'].max()
+            },
+            'earnings_timing': timing_counts.to_dict(),
+            'events_with_eps_estimates': int(df['eps_estimate'].notna().sum()),
+            'events_with_revenue_estimates': int(df['revenue_estimate'].notna().sum()),
+            'sectors_represented': sector_counts.to_dict() if sector_counts is not None else {},
+            'top_companies_by_market_cap': top_by_cap
+        }
+
+        return report
+
+
+# -----------------------------------------
+def main():
+
+    print("Financial Earnings Calendar Automation System")
+    print("=" * 60)
+
+    # init
+    scraper = EarningsCalendarScraper(
+        headless=False,  # T, prod
+        debug=True
+    )
+
+    try:
+        #
+        events = scraper.run_multi_day_scrape(
+            days=1, # 1 def, abeg
+            enrich_data=False  #
+        )
+
+        if events:
+            print(f"\nSuccessfully scraped {len(events)} earnings events!")
+
+            json_file = scraper.save_to_json()
+            csv_file = scraper.save_to_csv()
+
+            report = scraper.generate_summary_report()
+            print(f"\n SUMMARY REPORT:")
+            print(f"Total events: {report['total_events']}")
+            print(f"Unique companies: {report['unique_companies']}")
+            print(f"Date range: {report['date_range']['start']} to {report['date_range']['end']}")
+
+            #
+            print(f"\n SAMPLE EVENTS:")
+            for i, event in enumerate(events[:5]):
+                print(f"{i + 1}. {event.symbol} ({event.company_name}) - {event.earnings_date} {event.earnings_time}")
+
+            print(f"\n Files saved:")
+            print(f"   JSON: {json_file}")
+            print(f"   CSV: {csv_file}")
+
+        else:
+            print(" No earnings events found. Check logs for details.")
+
+    except Exception as e:
+        print(f" Scraping failed: {e}")
+
+    print("\n Scraping complete!")
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file